@@ -5,15 +5,18 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import functools
+import importlib.util
 import re
 import socket
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from http import HTTPStatus
+from typing import Any, ClassVar, Self
 
 import aiohttp
 import async_timeout
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 try:
     import zoneinfo
@@ -22,8 +25,30 @@ except ImportError:
 
 from .const import LOGGER
 
-
-@dataclass
+# Prefer the C-based lxml tree builder, fall back to the stdlib parser
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# Precompiled patterns used by the parsers
+# Match both ASCII 'C' and the Unicode DEGREE CELSIUS sign '\u2103'
+_RE_TEMPERATURE = re.compile(r"(-?\d+)[^\d]*(?:C|\u2103)")
+_RE_INTEGER = re.compile(r"(-?\d+)")
+_RE_DIGITS = re.compile(r"(\d+)")
+_RE_PERCENT = re.compile(r"(\d+)%")
+_RE_MM = re.compile(r"(\d+)\s*mm")
+_RE_PERCENT_OR_MM = re.compile(r"\d+%|\d+\s*mm")
+_RE_HEIGHT_PX = re.compile(r"height:\s*(\d+)px")
+_RE_ALERT_PREFIX = re.compile(r"^[\s\S]*?riasztás")
+# The popover HTML contains the forecast icon img; its alt attribute holds the
+# condition (works even when additional attributes like src exist). Older
+# popovers put the condition as text right after the img instead.
+_RE_POPOVER_ALT = re.compile(
+    r"forecastIcons/[^'\"]+['\"][^>]*alt=['\"]([^'\"]+)['\"]"
+    r"|alt=['\"]([^'\"]+)['\"][^>]*forecastIcons/"
+)
+_RE_POPOVER_TEXT = re.compile(r"forecastIcons/[^>]+>([^<]+)")
+
+
+@dataclass(slots=True)
 class WeatherData:
     """Structured weather data."""
 
@@ -38,7 +63,7 @@ class WeatherData:
     precipitation_probability: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HourlyForecastItem:
     """Single hourly forecast item."""
 
@@ -49,7 +74,7 @@ class HourlyForecastItem:
     precipitation_probability: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertData:
     """Single weather alert."""
 
@@ -59,7 +84,7 @@ class AlertData:
     icon_url: str | None = None  # URL to alert icon
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyForecastItem:
     """Single daily forecast item."""
 
@@ -71,12 +96,30 @@ class DailyForecastItem:
     precipitation_probability: int = 0
 
 
+@dataclass(slots=True)
+class PageResponse:
+    """Raw page body with its HTTP cache validators."""
+
+    body: bytes | None  # None when the server answered 304 Not Modified
+    etag: str | None = None
+    last_modified: str | None = None
+    charset: str | None = None  # From the Content-Type header, if declared
+
+
 # Configuration and constants
 class IdokepConfig:
     """Configuration for Időkép API."""
 
     BASE_URL = "https://www.idokep.hu"
     TIMEOUT = 5
+    # Shared budget for fetching all pages of one refresh
+    TOTAL_TIMEOUT = 8
+    MAX_RESPONSE_SIZE = 5_000_000
+    # Connection pool tuning for standalone sessions (see create_idokep_session)
+    CONNECTION_LIMIT = 10
+    CONNECTION_LIMIT_PER_HOST = 4
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
 
     @classmethod
     def get_current_weather_url(cls, location: str) -> str:
@@ -111,6 +154,15 @@ class IdokepApiClientConnectivityError(IdokepApiClientError):
     """Exception to indicate no internet connectivity."""
 
 
+# Errors a single page scrape can fail with; these degrade to empty data
+_SCRAPE_ERRORS = (
+    aiohttp.ClientError,
+    TimeoutError,
+    socket.gaierror,
+    IdokepApiClientCommunicationError,
+)
+
+
 # Weather condition mapper
 class WeatherConditionMapper:
     """Maps Hungarian weather conditions to Home Assistant standards."""
@@ -150,23 +202,35 @@ class WeatherConditionMapper:
     }
 
     @classmethod
+    @functools.lru_cache(maxsize=64)
     def map_condition(cls, condition: str) -> str:
         """Map Hungarian condition to Home Assistant standard condition."""
-        return cls._CONDITION_MAPPING.get(condition.lower(), "unknown")
+        # Try the input as-is first so lowercase input skips the lower() copy
+        mapping = cls._CONDITION_MAPPING
+        mapped = mapping.get(condition)
+        if mapped is not None:
+            return mapped
+        return mapping.get(condition.lower(), "unknown")
 
 
 # Time utilities
+# Resolved once at import so refreshes skip the tzdata lookup
+_LOCAL_TZ: datetime.tzinfo = (
+    zoneinfo.ZoneInfo("Europe/Budapest")
+    if zoneinfo is not None
+    else datetime.timezone(datetime.timedelta(hours=2))
+)
+# The UTC and local dates a page was parsed on; parsed data embeds both
+_ParseDay = tuple[datetime.date, datetime.date]
+
+
 class TimeUtils:
     """Utilities for time handling."""
 
     @staticmethod
     def get_local_timezone() -> datetime.tzinfo:
         """Get Budapest timezone."""
-        return (
-            zoneinfo.ZoneInfo("Europe/Budapest")
-            if zoneinfo is not None
-            else datetime.timezone(datetime.timedelta(hours=2))
-        )
+        return _LOCAL_TZ
 
     @staticmethod
     def extract_time_from_text(
@@ -176,23 +240,46 @@ class TimeUtils:
         local_tz: datetime.tzinfo,
     ) -> str | None:
         """Extract time from text and convert to ISO format."""
-        if label in text:
-            # Handle both "Napkelte 6:18" and "Napkelte: 6:18" formats
-            match = re.search(rf"{label}[:\s]*([0-9]{{1,2}}:[0-9]{{2}})", text)
-            if match:
-                time_str = match.group(1)
-                hour, minute = map(int, time_str.split(":"))
-                dt = datetime.datetime.combine(
-                    today, datetime.time(hour, minute, tzinfo=local_tz)
-                )
-                LOGGER.debug(
-                    "Extracted %s time: %s. Timezone: %s",
-                    label,
-                    dt.isoformat(),
-                    local_tz,
-                )
-                return dt.isoformat()
-        return None
+        # The label may repeat (e.g. a label span next to "Napkelte 6:18"),
+        # so try the text after each occurrence until one holds a time
+        start = text.find(label)
+        while start != -1:
+            hour_minute = TimeUtils._parse_hour_minute(text[start + len(label) :])
+            if hour_minute:
+                break
+            start = text.find(label, start + 1)
+        else:
+            return None
+
+        dt = datetime.datetime.combine(
+            today, datetime.time(*hour_minute, tzinfo=local_tz)
+        )
+        LOGGER.debug(
+            "Extracted %s time: %s. Timezone: %s",
+            label,
+            dt.isoformat(),
+            local_tz,
+        )
+        return dt.isoformat()
+
+    @staticmethod
+    def _parse_hour_minute(text: str) -> tuple[int, int] | None:
+        """Parse a leading "H:MM" time, skipping whitespace and colons before it."""
+        index = 0
+        while index < len(text) and (text[index].isspace() or text[index] == ":"):
+            index += 1
+        hour_text, colon, rest = text[index:].partition(":")
+        digits = 2
+        minute_text = rest[:digits]
+        if not (
+            colon
+            and len(hour_text) <= digits
+            and hour_text.isdecimal()
+            and len(minute_text) == digits
+            and minute_text.isdecimal()
+        ):
+            return None
+        return int(hour_text), int(minute_text)
 
 
 # HTTP client wrapper
@@ -220,15 +307,58 @@ class HttpClient:
         except (aiohttp.ClientError, TimeoutError, socket.gaierror, OSError):
             return False
 
-    async def get_html(self, url: str) -> str:
-        """Get HTML content from URL with error handling."""
+    async def get_html(
+        self, url: str, request_timeout: float | None = IdokepConfig.TIMEOUT
+    ) -> bytes:
+        """
+        Get raw HTML bytes from URL with error handling.
+
+        Pass request_timeout=None when the caller enforces its own deadline.
+        """
+        page = await self.get_page(url, request_timeout)
+        return page.body or b""
+
+    async def get_page(
+        self,
+        url: str,
+        request_timeout: float | None = IdokepConfig.TIMEOUT,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> PageResponse:
+        """
+        Conditionally fetch a page.
+
+        When validators from an earlier response are given and the page is
+        unchanged, the returned body is None.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
         try:
             async with (
-                async_timeout.timeout(IdokepConfig.TIMEOUT),
-                self._session.get(url) as response,
+                async_timeout.timeout(request_timeout),
+                self._session.get(url, headers=headers) as response,
             ):
+                if headers and response.status == HTTPStatus.NOT_MODIFIED:
+                    return PageResponse(None, etag, last_modified)
                 response.raise_for_status()
-                return await response.text()
+                content_length = response.content_length
+                if (
+                    content_length is not None
+                    and content_length > IdokepConfig.MAX_RESPONSE_SIZE
+                ):
+                    msg = f"Response from {url} too large ({content_length} bytes)"
+                    raise IdokepApiClientCommunicationError(msg)
+                # Bytes go to the parser as-is; the header charset spares it
+                # from sniffing the encoding
+                return PageResponse(
+                    await self._read_limited(response, url),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    response.charset,
+                )
         except TimeoutError as exception:
             msg = f"Timeout error fetching {url} - {exception}"
             raise IdokepApiClientCommunicationError(msg) from exception
@@ -236,11 +366,28 @@ class HttpClient:
             msg = f"Error fetching {url} - {exception}"
             raise IdokepApiClientCommunicationError(msg) from exception
 
+    @staticmethod
+    async def _read_limited(response: aiohttp.ClientResponse, url: str) -> bytes:
+        """Read the body, giving up once it exceeds MAX_RESPONSE_SIZE."""
+        # Chunked responses carry no Content-Length, so count while reading
+        limit = IdokepConfig.MAX_RESPONSE_SIZE
+        body = bytearray()
+        while chunk := await response.content.read(limit + 1 - len(body)):
+            body += chunk
+            if len(body) > limit:
+                msg = f"Response from {url} too large (over {limit} bytes)"
+                raise IdokepApiClientCommunicationError(msg)
+        return bytes(body)
+
 
 # Abstract base for parsers
 class WeatherParser(ABC):
     """Abstract base class for weather data parsers."""
 
+    # Classes of the divs this parser reads, so pages can be parsed with a
+    # SoupStrainer; None means the parser needs the whole document
+    STRAINER_CLASSES: ClassVar[frozenset[str] | None] = None
+
     @abstractmethod
     def parse(self, soup: BeautifulSoup) -> dict[str, Any]:
         """Parse weather data from BeautifulSoup object."""
@@ -250,6 +397,9 @@ class WeatherParser(ABC):
 class CurrentWeatherParser(WeatherParser):
     """Parser for current weather data."""
 
+    # pt-2 divs holding plain text only, used as the short forecast fallback
+    SHORT_FORECAST_FALLBACK_SELECTOR = "div.pt-2:not(:has(img, button))"
+
     def parse(self, soup: BeautifulSoup) -> dict[str, Any]:
         """Parse current weather data."""
         result = {}
@@ -257,8 +407,7 @@ class CurrentWeatherParser(WeatherParser):
         # Temperature
         temp_div = soup.find("div", class_="current-temperature")
         if isinstance(temp_div, Tag):
-            # Match both ASCII 'C' and the Unicode DEGREE CELSIUS sign '\u2103'
-            match = re.search(r"(-?\d+)[^\d]*(?:C|\u2103)", temp_div.text)
+            match = _RE_TEMPERATURE.search(temp_div.text)
             if match:
                 result["temperature"] = int(match.group(1))
 
@@ -298,31 +447,23 @@ class CurrentWeatherParser(WeatherParser):
         today = datetime.datetime.now(tz=local_tz).date()
         result = {}
 
-        for div in soup.find_all("div"):
-            if not isinstance(div, Tag):
-                continue
-            img = div.find("img")
-            if img and isinstance(img, Tag):
-                alt = str(img.attrs.get("alt", ""))
-
-                # Check if this div contains sunrise or sunset info
-                if "Napkelte" in alt or "Napnyugta" in alt:
-                    # Get the text content of the div which contains the time
-                    div_text = div.get_text(strip=True)
-
-                    if "Napkelte" in alt:
-                        sunrise_iso = TimeUtils.extract_time_from_text(
-                            "Napkelte", div_text, today, local_tz
-                        )
-                        if sunrise_iso:
-                            result["sunrise"] = sunrise_iso
-
-                    if "Napnyugta" in alt:
-                        sunset_iso = TimeUtils.extract_time_from_text(
-                            "Napnyugta", div_text, today, local_tz
-                        )
-                        if sunset_iso:
-                            result["sunset"] = sunset_iso
+        # Only visit the sunrise/sunset icons instead of every div on the page
+        for img in soup.select("img[alt*='Napkelte'], img[alt*='Napnyugta']"):
+            alt = str(img.attrs.get("alt", ""))
+            for label, key in (("Napkelte", "sunrise"), ("Napnyugta", "sunset")):
+                if label not in alt:
+                    continue
+                # The time is in the text of the enclosing div; walk outwards
+                # until one of them contains it
+                for div in img.find_parents("div"):
+                    iso = TimeUtils.extract_time_from_text(
+                        label, div.get_text(strip=True), today, local_tz
+                    )
+                    if iso:
+                        result[key] = iso
+                        break
+            if "sunrise" in result and "sunset" in result:
+                break
 
         return result
 
@@ -346,43 +487,47 @@ class CurrentWeatherParser(WeatherParser):
                 return text
 
         # Last-resort fallback: look for non-image pt-2 divs
-        for div in soup.find_all("div", class_="pt-2"):
-            if not isinstance(div, Tag):
-                continue
-            if not div.find("img") and not div.find("button"):
-                text = div.get_text(strip=True)
-                if text and "Napkelte" not in text and "Napnyugta" not in text:
-                    return text
+        for div in soup.select(self.SHORT_FORECAST_FALLBACK_SELECTOR):
+            text = div.get_text(strip=True)
+            if text and "Napkelte" not in text and "Napnyugta" not in text:
+                return text
         return None
 
     def extract_current_precipitation(self, soup: BeautifulSoup) -> dict[str, int]:
         """Extract current precipitation data."""
         result = {"precipitation": 0, "precipitation_probability": 0}
 
-        # Look for precipitation probability
-        for element in soup.find_all(["div", "span"], string=re.compile(r"\d+%")):
-            if isinstance(element, Tag):
+        # One walk for both values: the first percentage next to a precipitation
+        # keyword is the probability, the first mm value is the amount. The
+        # text is matched here rather than via find_all(string=...), so the
+        # regex stops running once both values are found.
+        found_probability = found_amount = False
+        for element in soup.find_all(["div", "span"]):
+            text = element.string
+            if text is None or not _RE_PERCENT_OR_MM.search(text):
+                continue
+            if not found_probability:
+                percent_match = _RE_PERCENT.search(text)
                 parent = element.parent
-                if parent and isinstance(parent, Tag):
+                if percent_match and parent:
                     parent_text = parent.get_text().lower()
-                    if any(
-                        keyword in parent_text
-                        for keyword in ["csapadék", "eső", "precipitation"]
+                    # Explicit or-chain short-circuits without a generator frame
+                    if (
+                        "csapadék" in parent_text
+                        or "eső" in parent_text
+                        or "precipitation" in parent_text
                     ):
-                        percent_match = re.search(r"(\d+)%", element.text)
-                        if percent_match:
-                            result["precipitation_probability"] = int(
-                                percent_match.group(1)
-                            )
-                            break
-
-        # Look for precipitation amount
-        for element in soup.find_all(["div", "span"], string=re.compile(r"\d+\s*mm")):
-            if isinstance(element, Tag):
-                mm_match = re.search(r"(\d+)\s*mm", element.text)
+                        result["precipitation_probability"] = int(
+                            percent_match.group(1)
+                        )
+                        found_probability = True
+            if not found_amount:
+                mm_match = _RE_MM.search(text)
                 if mm_match:
                     result["precipitation"] = int(mm_match.group(1))
-                    break
+                    found_amount = True
+            if found_probability and found_amount:
+                break
 
         return result
 
@@ -390,6 +535,11 @@ class CurrentWeatherParser(WeatherParser):
 class AlertParser(WeatherParser):
     """Parser for weather alerts."""
 
+    # The top alert bar only counts when it carries a level class
+    STRAINER_CLASSES: ClassVar[frozenset[str] | None] = frozenset(
+        ("genericHourlyAlert", "yellow", "orange", "red")
+    )
+
     # Mapping of Hungarian alert types to English names
     ALERT_TYPE_MAP: ClassVar[dict[str, str]] = {
         "ónos eső": "freezing_rain",
@@ -427,7 +577,7 @@ class AlertParser(WeatherParser):
         alerts = []
         alert_bar = soup.find("div", id="topalertbar")
 
-        if not alert_bar or not isinstance(alert_bar, Tag):
+        if not isinstance(alert_bar, Tag):
             return alerts
 
         # Determine alert level from class
@@ -446,10 +596,10 @@ class AlertParser(WeatherParser):
 
         # Extract alert text
         link = alert_bar.find("a")
-        if link and isinstance(link, Tag):
+        if isinstance(link, Tag):
             description = link.get_text(strip=True)
             # Remove the icon text
-            description = re.sub(r"^[\s\S]*?riasztás", "riasztás", description)
+            description = _RE_ALERT_PREFIX.sub("riasztás", description)
             description = description.strip()
 
             # Extract alert type
@@ -475,12 +625,9 @@ class AlertParser(WeatherParser):
         alert_containers = soup.find_all("div", class_="genericHourlyAlert")
 
         for container in alert_containers:
-            if not isinstance(container, Tag):
-                continue
-
             # Find the alert link/image
             alert_link = container.find("a", class_="hover-over")
-            if not alert_link or not isinstance(alert_link, Tag):
+            if not isinstance(alert_link, Tag):
                 continue
 
             # Extract alert description from data-bs-content
@@ -507,7 +654,7 @@ class AlertParser(WeatherParser):
             # Extract icon URL
             img = alert_link.find("img", class_="forecast-alert-icon")
             icon_url = None
-            if img and isinstance(img, Tag):
+            if isinstance(img, Tag):
                 src = img.get("src")
                 if src and isinstance(src, str):
                     icon_url = (
@@ -561,6 +708,26 @@ class AlertParser(WeatherParser):
 class HourlyForecastParser(WeatherParser):
     """Parser for hourly forecast data."""
 
+    STRAINER_CLASSES: ClassVar[frozenset[str] | None] = frozenset(
+        ("wide-hourly-forecast-card",)
+    )
+
+    HOURS_PER_DAY = 24
+    MINUTES_PER_HOUR = 60
+
+    # Per-card CSS selectors for the containers holding each field
+    HOUR_SELECTOR = "div.ik.wide-hourly-forecast-hour"
+    TEMPERATURE_SELECTOR = "div.ik.tempValue"
+    CONDITION_SELECTOR = "div.forecast-icon-container"
+    RAIN_CHANCE_SELECTOR = "div.ik.hourly-rain-chance"
+    RAINLEVEL_SELECTOR = "div.ik.rainlevel, div.ik.rainlevel-na"
+
+    # All field containers of a card, found with one subtree query
+    FIELDS_SELECTOR = (
+        f"{TEMPERATURE_SELECTOR}, {CONDITION_SELECTOR}, "
+        f"{RAIN_CHANCE_SELECTOR}, {RAINLEVEL_SELECTOR}"
+    )
+
     def parse(self, soup: BeautifulSoup) -> dict[str, Any]:
         """Parse hourly forecast data."""
         result = {}
@@ -570,20 +737,17 @@ class HourlyForecastParser(WeatherParser):
         # Start from tomorrow at midnight as the base date
         base_date = (now + datetime.timedelta(days=1)).date()
 
-        hourly_cards = soup.find_all("div", class_="ik wide-hourly-forecast-card")
+        hourly_cards = soup.select("div.ik.wide-hourly-forecast-card")
 
         last_hour = None
         current_date = base_date
 
         for card in hourly_cards:
-            if not isinstance(card, Tag):
-                continue
-
             # Extract hour first to detect day transitions
-            hour_div = card.find("div", class_="ik wide-hourly-forecast-hour")
-            if hour_div and isinstance(hour_div, Tag):
-                hour_text = hour_div.text.strip()
-                hour_int = int(hour_text.split(":")[0])
+            hour_div = card.select_one(self.HOUR_SELECTOR)
+            hour_minute = self._parse_hour(hour_div) if hour_div else None
+            if hour_minute:
+                hour_int = hour_minute[0]
 
                 # If hour decreased, we moved to next day
                 if last_hour is not None and hour_int < last_hour:
@@ -591,7 +755,9 @@ class HourlyForecastParser(WeatherParser):
 
                 last_hour = hour_int
 
-            forecast_item = self._parse_hourly_card(card, hour_div, current_date)
+            forecast_item = self._parse_hourly_card(
+                card, hour_div, current_date, hour_minute
+            )
             if forecast_item:
                 forecast.append(forecast_item)
 
@@ -600,66 +766,80 @@ class HourlyForecastParser(WeatherParser):
 
         return result
 
+    @staticmethod
+    def _parse_hour(hour_div: Tag) -> tuple[int, int] | None:
+        """Parse "HH:MM" (or a bare "HH") from the hour div."""
+        hour_text, _, minute_text = hour_div.text.strip().partition(":")
+        try:
+            return int(hour_text), int(minute_text) if minute_text else 0
+        except ValueError:
+            return None
+
     def _parse_hourly_card(
         self,
         card: Tag,
         hour_div: Tag | None,
         forecast_date: datetime.date,
+        hour_minute: tuple[int, int] | None = None,
     ) -> dict[str, Any] | None:
-        """Parse individual hourly forecast card."""
-        temp_div = card.find("div", class_="ik tempValue")  # class unchanged
+        """
+        Parse individual hourly forecast card.
 
-        if not (
-            hour_div
-            and temp_div
-            and isinstance(hour_div, Tag)
-            and isinstance(temp_div, Tag)
-        ):
+        hour_minute may be passed when the caller has already parsed hour_div.
+        """
+        fields = self._collect_fields(card)
+        temp_div = fields.get("temperature")
+        if not (hour_div and temp_div):
+            return None
+        if hour_minute is None:
+            hour_minute = self._parse_hour(hour_div)
+        if hour_minute is None:
+            return None
+        hour, minute = hour_minute
+        # Reject impossible times such as 25:00
+        if not (0 <= hour < self.HOURS_PER_DAY and 0 <= minute < self.MINUTES_PER_HOUR):
             return None
 
         temp_a = temp_div.find("a")
         temp = None
-        if temp_a and isinstance(temp_a, Tag):
+        if temp_a is not None:
             with contextlib.suppress(ValueError):
                 temp = int(temp_a.text.strip())
 
-        condition = self.extract_condition(card)
-        precipitation, precipitation_probability = self.extract_precipitation_data(card)
-
-        try:
-            # Extract time and combine with the provided date
-            hour_text = hour_div.text.strip()
-            hour_int = int(hour_text.split(":")[0])
-            minute_int = int(hour_text.split(":")[1]) if ":" in hour_text else 0
+        condition = self._condition_from_container(fields.get("condition"))
+        precipitation = self._amount_from_rainlevel(fields.get("rainlevel"))
+        precipitation_probability = self._probability_from_container(
+            fields.get("rain_chance")
+        )
 
-            dt = datetime.datetime.combine(
-                forecast_date, datetime.time(hour_int, minute_int)
-            )
+        return {
+            # Same as datetime.combine(...).isoformat(), without the objects
+            "datetime": f"{forecast_date.isoformat()}T{hour:02d}:{minute:02d}:00",
+            "temperature": temp,
+            "condition": condition,
+            "precipitation": precipitation,
+            "precipitation_probability": precipitation_probability,
+        }
 
-            return {
-                "datetime": dt.isoformat(),
-                "temperature": temp,
-                "condition": condition,
-                "precipitation": precipitation,
-                "precipitation_probability": precipitation_probability,
-            }
-        except (ValueError, IndexError):
-            return None
+    def _collect_fields(self, card: Tag) -> dict[str, Tag]:
+        """Collect the first container of each field in a single card walk."""
+        fields: dict[str, Tag] = {}
+        for div in card.select(self.FIELDS_SELECTOR):
+            classes = div.get_attribute_list("class")
+            if "tempValue" in classes:
+                key = "temperature"
+            elif "forecast-icon-container" in classes:
+                key = "condition"
+            elif "hourly-rain-chance" in classes:
+                key = "rain_chance"
+            else:
+                key = "rainlevel"
+            fields.setdefault(key, div)
+        return fields
 
     def extract_condition(self, card: Tag) -> str | None:
         """Extract weather condition from the icon container tag."""
-        icon_container_elem = card.find("div", class_="forecast-icon-container")
-        icon_container = (
-            icon_container_elem if isinstance(icon_container_elem, Tag) else None
-        )
-        condition = None
-        if icon_container and isinstance(icon_container, Tag):
-            icon_a = icon_container.find("a")
-            if icon_a and isinstance(icon_a, Tag):
-                condition_val = icon_a.get("data-bs-content")
-                if isinstance(condition_val, str):
-                    condition = WeatherConditionMapper.map_condition(condition_val)
-        return condition
+        return self._condition_from_container(card.select_one(self.CONDITION_SELECTOR))
 
     def extract_precipitation_data(self, card: Tag) -> tuple[int, int]:
         """Extract precipitation data from hourly card."""
@@ -669,12 +849,39 @@ class HourlyForecastParser(WeatherParser):
 
     def extract_precipitation_probability(self, card: Tag) -> int:
         """Extract precipitation probability."""
-        rain_chance_div = card.find("div", class_="ik hourly-rain-chance")
-        if not (rain_chance_div and isinstance(rain_chance_div, Tag)):
-            return 0
+        return self._probability_from_container(
+            card.select_one(self.RAIN_CHANCE_SELECTOR)
+        )
+
+    def extract_precipitation_amount(self, card: Tag) -> int:
+        """
+        Extract precipitation amount from hourly card.
+
+        The new frontend no longer encodes mm values as class names.
+        We detect the presence of a non-N/A rainlevel div and estimate from
+        the inline height style (each pixel roughly represents ~1 mm).
+        Returns 0 when no rain is indicated.
+        """
+        # One lookup for either marker; rainlevel-na means no precipitation
+        return self._amount_from_rainlevel(card.select_one(self.RAINLEVEL_SELECTOR))
 
-        rain_a = rain_chance_div.find("a")
-        if not (rain_a and isinstance(rain_a, Tag)):
+    @staticmethod
+    def _condition_from_container(container: Tag | None) -> str | None:
+        """Map the popover content of the icon link inside the container."""
+        if container is None:
+            return None
+        icon_a = container.find("a", attrs={"data-bs-content": True})
+        if icon_a is not None:
+            condition_val = icon_a.get("data-bs-content")
+            if isinstance(condition_val, str):
+                return WeatherConditionMapper.map_condition(condition_val)
+        return None
+
+    @staticmethod
+    def _probability_from_container(container: Tag | None) -> int:
+        """Read the "NN%" link text inside the rain chance container."""
+        rain_a = container.find("a") if container is not None else None
+        if rain_a is None:
             return 0
 
         rain_text = rain_a.text.strip()
@@ -686,28 +893,18 @@ class HourlyForecastParser(WeatherParser):
         except ValueError:
             return 0
 
-    def extract_precipitation_amount(self, card: Tag) -> int:
-        """
-        Extract precipitation amount from hourly card.
-
-        The new frontend no longer encodes mm values as class names.
-        We detect the presence of a non-N/A rainlevel div and estimate from
-        the inline height style (each pixel roughly represents ~1 mm).
-        Returns 0 when no rain is indicated.
-        """
-        # rainlevel-na means no precipitation
-        if card.find("div", class_="ik rainlevel-na"):
+    @staticmethod
+    def _amount_from_rainlevel(rainlevel_div: Tag | None) -> int:
+        """Estimate precipitation in mm from a rainlevel div."""
+        if rainlevel_div is None:
             return 0
-
-        # Look for a generic rainlevel div (new format uses style height)
-        rainlevel_div = card.find("div", class_="ik rainlevel")
-        if not (rainlevel_div and isinstance(rainlevel_div, Tag)):
+        if "rainlevel-na" in rainlevel_div.get_attribute_list("class"):
             return 0
 
         # Try to parse height from inline style (e.g. style="height: 5px;")
         style = rainlevel_div.get("style", "")
         if isinstance(style, str):
-            height_match = re.search(r"height:\s*(\d+)px", style)
+            height_match = _RE_HEIGHT_PX.search(style)
             if height_match:
                 # Each pixel is roughly proportional to mm; treat as integer mm
                 return int(height_match.group(1))
@@ -723,18 +920,22 @@ class HourlyForecastParser(WeatherParser):
 class DailyForecastParser(WeatherParser):
     """Parser for daily forecast data."""
 
+    STRAINER_CLASSES: ClassVar[frozenset[str] | None] = frozenset(("dailyForecastCol",))
+
+    # Tags a column is walked for; covers every field container and the
+    # percentage texts read for the precipitation probability
+    FIELD_TAGS = ("span", "div", "a")
+
     def parse(self, soup: BeautifulSoup) -> dict[str, Any]:
         """Parse daily forecast data."""
         result = {}
         daily_forecast = []
-        daily_cols = soup.find_all("div", class_="ik dailyForecastCol")
-        today = datetime.datetime.now(tz=datetime.UTC).date()
+        daily_cols = soup.select("div.ik.dailyForecastCol")
+        # Step dates by ordinal instead of building a timedelta per column
+        today_ordinal = datetime.datetime.now(tz=datetime.UTC).date().toordinal()
 
         for i, col in enumerate(daily_cols):
-            if not isinstance(col, Tag):
-                continue
-
-            forecast_date = today + datetime.timedelta(days=i)
+            forecast_date = datetime.date.fromordinal(today_ordinal + i)
             forecast_item = self._parse_daily_column(col, forecast_date)
             daily_forecast.append(forecast_item)
 
@@ -747,13 +948,18 @@ class DailyForecastParser(WeatherParser):
         self, col: Tag, forecast_date: datetime.date
     ) -> dict[str, Any]:
         """Parse individual daily forecast column."""
-        min_temp, max_temp = self.extract_temperatures(col)
-        condition = self.extract_condition(col)
-        precipitation = self.extract_precipitation(col)
-        precipitation_probability = self.extract_precipitation_probability(col)
+        # One descendant walk; the field containers are picked out by class
+        elements = col.find_all(self.FIELD_TAGS)
+        fields = self._collect_fields(elements)
+        min_temp, max_temp = self._temperatures_from_divs(
+            fields.get("close"), fields.get("min"), fields.get("max")
+        )
+        condition = self._condition_from_icon(fields.get("icon"))
+        precipitation = self._precipitation_from_span(fields.get("mm"))
+        precipitation_probability = self._probability_from_elements(elements)
 
         return {
-            "datetime": str(forecast_date),
+            "datetime": forecast_date.isoformat(),
             "temperature": max_temp,
             "templow": min_temp,
             "condition": condition,
@@ -769,64 +975,104 @@ class DailyForecastParser(WeatherParser):
             tuple: (min_temp, max_temp)
 
         """
-        # First check for min-max-close or min-max-closer div (when temps are close)
-        close_div = col.find("div", class_=["ik min-max-close", "ik min-max-closer"])
-        if close_div and isinstance(close_div, Tag):
+        fields = self._collect_fields(col.find_all("div"))
+        return self._temperatures_from_divs(
+            fields.get("close"), fields.get("min"), fields.get("max")
+        )
+
+    @staticmethod
+    def _collect_fields(elements: list[Tag]) -> dict[str, Tag]:
+        """Pick the first container of each field out of a column's elements."""
+        fields: dict[str, Tag] = {}
+        for element in elements:
+            if element.name == "a":
+                continue
+            classes = element.get_attribute_list("class")
+            if "ik" not in classes:
+                continue
+            if element.name == "span":
+                if "mm" not in classes:
+                    continue
+                key = "mm"
+            elif "min-max-close" in classes or "min-max-closer" in classes:
+                key = "close"
+            elif "min" in classes:
+                key = "min"
+            elif "max" in classes:
+                key = "max"
+            elif "dfIconAlert" in classes:
+                key = "icon"
+            else:
+                continue
+            fields.setdefault(key, element)
+        return fields
+
+    def _temperatures_from_divs(
+        self, close_div: Tag | None, min_div: Tag | None, max_div: Tag | None
+    ) -> tuple[int | None, int | None]:
+        """Read (min_temp, max_temp) from the temperature containers."""
+        # A min-max-close or min-max-closer div is used when temps are close
+        if close_div:
             a_tags = close_div.find_all("a")
             min_required_tags = 2
             if len(a_tags) >= min_required_tags:
                 # First <a> is max, second is min
-                max_match = re.search(r"(-?\d+)", a_tags[0].get_text(strip=True))
-                min_match = re.search(r"(-?\d+)", a_tags[1].get_text(strip=True))
+                max_match = _RE_INTEGER.search(a_tags[0].get_text(strip=True))
+                min_match = _RE_INTEGER.search(a_tags[1].get_text(strip=True))
                 max_temp = int(max_match.group(1)) if max_match else None
                 min_temp = int(min_match.group(1)) if min_match else None
                 return (min_temp, max_temp)
 
-        # Otherwise, look for separate max and min divs
-        min_temp = self.extract_temperature(col, "ik min")
-        max_temp = self.extract_temperature(col, "ik max")
-        return (min_temp, max_temp)
+        # Otherwise, use the separate max and min divs
+        return (
+            self._parse_temperature_div(min_div),
+            self._parse_temperature_div(max_div),
+        )
 
     def extract_temperature(self, col: Tag, class_name: str) -> int | None:
         """Extract temperature from column."""
         temp_div = col.find("div", class_=class_name)
-        if temp_div and isinstance(temp_div, Tag):
+        return self._parse_temperature_div(temp_div)
+
+    @staticmethod
+    def _parse_temperature_div(temp_div: Tag | None) -> int | None:
+        """Parse the temperature from the first link of a temperature div."""
+        if temp_div:
             temp_a = temp_div.find("a")
-            if temp_a and isinstance(temp_a, Tag):
-                match = re.search(r"(-?\d+)", temp_a.get_text(strip=True))
+            if temp_a is not None:
+                match = _RE_INTEGER.search(temp_a.get_text(strip=True))
                 if match:
                     return int(match.group(1))
         return None
 
     def extract_condition(self, col: Tag) -> str | None:
         """Extract weather condition from column."""
-        icon_alert = col.find("div", class_="ik dfIconAlert")
-        if not (icon_alert and isinstance(icon_alert, Tag)):
+        return self._condition_from_icon(col.find("div", class_="ik dfIconAlert"))
+
+    @staticmethod
+    def _condition_from_icon(icon_alert: Tag | None) -> str | None:
+        """Map the condition named in the icon's popover content."""
+        if icon_alert is None:
             return None
 
         a_tag = icon_alert.find("a")
-        if not (a_tag and isinstance(a_tag, Tag)):
+        if a_tag is None:
             return None
 
         popover = a_tag.get("data-bs-content")
         if not isinstance(popover, str):
             return None
 
-        # The popover HTML contains the forecast icon img; extract condition from
-        # its alt attribute (works even when additional attributes like src exist):
         # e.g. <img class='ik popover-icon' src='...forecastIcons/...' alt='zápor'>
-        alt_match = re.search(
-            r"forecastIcons/[^'\"]+['\"][^>]*alt=['\"]([^'\"]+)['\"]"
-            r"|alt=['\"]([^'\"]+)['\"][^>]*forecastIcons/",
-            popover,
-        )
+        # A non-blank alt anywhere wins over text after an icon
+        alt_match = _RE_POPOVER_ALT.search(popover)
         if alt_match:
-            condition_text = (alt_match.group(1) or alt_match.group(2) or "").strip()
+            condition_text = (alt_match.group(1) or alt_match.group(2)).strip()
             if condition_text:
                 return WeatherConditionMapper.map_condition(condition_text)
 
         # Fallback: grab text immediately after any forecast icon img closing >
-        text_match = re.search(r"forecastIcons/[^>]+>([^<]+)", popover)
+        text_match = _RE_POPOVER_TEXT.search(popover)
         if text_match:
             return WeatherConditionMapper.map_condition(text_match.group(1).strip())
 
@@ -834,96 +1080,284 @@ class DailyForecastParser(WeatherParser):
 
     def extract_precipitation(self, col: Tag) -> int:
         """Extract precipitation amount."""
-        precip_span = col.find("span", class_="ik mm")
-        if precip_span and isinstance(precip_span, Tag):
+        return self._precipitation_from_span(col.find("span", class_="ik mm"))
+
+    @staticmethod
+    def _precipitation_from_span(precip_span: Tag | None) -> int:
+        """Read the mm amount from the precipitation span."""
+        if precip_span is not None:
             precip_text = precip_span.text.strip()
             if precip_text:
-                match = re.search(r"(\d+)", precip_text)
+                match = _RE_DIGITS.search(precip_text)
                 if match:
                     return int(match.group(1))
         return 0
 
     def extract_precipitation_probability(self, col: Tag) -> int:
         """Extract precipitation probability."""
-        # Look for percentage values
-        for element in col.find_all(["span", "div", "a"], string=re.compile(r"\d+%")):
-            if isinstance(element, Tag):
-                percent_text = element.text.strip()
+        return self._probability_from_elements(col.find_all(self.FIELD_TAGS))
+
+    @staticmethod
+    def _probability_from_elements(elements: list[Tag]) -> int:
+        """Find the precipitation probability among a column's elements."""
+        # A visible percentage wins immediately, a percentage from a popover
+        # attribute is only kept as a fallback
+        fallback = None
+        for element in elements:
+            text = element.string
+            if text is not None:
+                percent_text = text.strip()
                 if percent_text.endswith("%"):
-                    try:
+                    with contextlib.suppress(ValueError):
                         return int(percent_text[:-1])
-                    except ValueError:
-                        continue
-
-        # Look for data attributes
-        for element in col.find_all(["a", "div"], attrs={"data-bs-content": True}):
-            if isinstance(element, Tag):
-                content = element.get("data-bs-content")
-                if isinstance(content, str) and (
-                    "csapadék" in content.lower() or "precipitation" in content.lower()
-                ):
-                    percent_match = re.search(r"(\d+)%", content)
-                    if percent_match:
-                        try:
-                            return int(percent_match.group(1))
-                        except ValueError:
-                            continue
 
-        return 0
+            if fallback is not None or element.name == "span":
+                continue
+            content = element.get("data-bs-content")
+            if not isinstance(content, str):
+                continue
+            content_lower = content.lower()
+            if "csapadék" in content_lower or "precipitation" in content_lower:
+                percent_match = _RE_PERCENT.search(content)
+                if percent_match:
+                    fallback = int(percent_match.group(1))
+
+        return fallback if fallback is not None else 0
 
 
 # Main API client - simplified and focused
 class IdokepApiClient:
     """Refactored API client with separation of concerns."""
 
-    def __init__(self, session: aiohttp.ClientSession) -> None:
-        """Initialize the API client."""
-        self._http_client = HttpClient(session)
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """
+        Initialize the API client.
+
+        The session should keep connections alive so the pages fetched on each
+        refresh reuse one TLS connection. Home Assistant's shared client session
+        already does this. Without a session the client creates one via
+        create_idokep_session(); it must then be constructed inside a running
+        event loop and closed with close() or by using it as an async context
+        manager.
+        """
+        # Only a session created here is closed by close()
+        self._owned_session = create_idokep_session() if session is None else None
+        self._http_client = HttpClient(session or self._owned_session)
         self._current_parser = CurrentWeatherParser()
         self._hourly_parser = HourlyForecastParser()
         self._daily_parser = DailyForecastParser()
         self._alert_parser = AlertParser()
+        # Per-URL (parse day, ETag, Last-Modified, parsed data) from the last
+        # full fetch
+        self._page_cache: dict[
+            str, tuple[_ParseDay, str | None, str | None, dict[str, Any]]
+        ] = {}
+        # Updates in flight per location, shared by concurrent callers
+        self._pending_updates: dict[str, asyncio.Future[dict[str, Any]]] = {}
+
+    async def __aenter__(self) -> Self:
+        """Return the client for use in an async with block."""
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Close the session the client created, if any."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the session the client created; a passed-in one stays open."""
+        if self._owned_session is not None:
+            await self._owned_session.close()
 
     async def check_connectivity(self) -> bool:
         """Check if idokep.hu is reachable."""
         return await self._http_client.check_connectivity()
 
     async def async_get_weather_data(self, location: str) -> dict[str, Any]:
-        """Get comprehensive weather data for location."""
-        # Check connectivity first
-        if not await self.check_connectivity():
+        """
+        Get comprehensive weather data for location.
+
+        There is no separate connectivity preflight; when every page fails to
+        connect, IdokepApiClientConnectivityError is raised instead. Concurrent
+        calls for the same location share a single update.
+        """
+        update = self._pending_updates.get(location)
+        if update is None:
+            update = asyncio.ensure_future(self._fetch_weather_data(location))
+            self._pending_updates[location] = update
+            update.add_done_callback(functools.partial(self._forget_update, location))
+        # Shielded so a cancelled caller does not cancel the shared update
+        return await asyncio.shield(update)
+
+    def _forget_update(
+        self, location: str, update: asyncio.Future[dict[str, Any]]
+    ) -> None:
+        """Drop a finished update so the next call fetches fresh data."""
+        self._pending_updates.pop(location, None)
+        if not update.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            update.exception()
+
+    async def _fetch_weather_data(self, location: str) -> dict[str, Any]:
+        """Fetch and parse all pages for location."""
+        current_url = IdokepConfig.get_current_weather_url(location)
+        hourly_url = IdokepConfig.get_hourly_forecast_url(location)
+        daily_url = IdokepConfig.get_daily_forecast_url(location)
+
+        # Each page is fetched and parsed once; alerts are on the hourly page
+        parsers_by_url: dict[str, tuple[WeatherParser, ...]] = {
+            current_url: (self._current_parser,),
+            hourly_url: (self._hourly_parser, self._alert_parser),
+            daily_url: (self._daily_parser,),
+        }
+        # Taken before parsing, so data parsed around midnight is never
+        # tagged with a day later than the one it was parsed on
+        parse_day = self._parse_day()
+        pages = await self._fetch_pages(tuple(parsers_by_url), parse_day)
+        failures = [page for page in pages.values() if isinstance(page, BaseException)]
+        if len(failures) == len(pages) and all(
+            self._is_connectivity_failure(failure) for failure in failures
+        ):
             LOGGER.warning(
                 "No internet connectivity to idokep.hu, skipping weather data update"
             )
             msg = "No internet connectivity to idokep.hu"
-            raise IdokepApiClientConnectivityError(msg)
+            raise IdokepApiClientConnectivityError(msg) from failures[0]
+
+        # Skip pages that could not be fetched, reuse unchanged ones
+        data: dict[str, Any] = {}
+        jobs: list[tuple[str, PageResponse]] = []
+        for url, page in pages.items():
+            if isinstance(page, BaseException):
+                LOGGER.warning("Failed to scrape some weather data: %s", page)
+            elif page.body is None:
+                data.update(self._page_cache[url][3])
+            else:
+                jobs.append((url, page))
+
+        # Parsing is CPU-bound, keep it off the event loop; a page that fails
+        # to parse is dropped like one that failed to fetch
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._parse_page,
+                    page.body,
+                    *parsers_by_url[url],
+                    encoding=page.charset,
+                )
+                for url, page in jobs
+            ),
+            return_exceptions=True,
+        )
 
-        urls = [
-            IdokepConfig.get_current_weather_url(location),
-            IdokepConfig.get_hourly_forecast_url(location),
-            IdokepConfig.get_daily_forecast_url(location),
-        ]
+        for (url, page), result in zip(jobs, results, strict=True):
+            if isinstance(result, BaseException):
+                LOGGER.warning("Failed to scrape some weather data: %s", result)
+                continue
+            if page.etag or page.last_modified:
+                self._page_cache[url] = (
+                    parse_day,
+                    page.etag,
+                    page.last_modified,
+                    result,
+                )
+            else:
+                # Never revalidate against validators of an older version
+                self._page_cache.pop(url, None)
+            data.update(result)
+        return data
 
+    @staticmethod
+    def _parse_day() -> _ParseDay:
+        """Return the dates the parsers stamp onto the data they return."""
+        # Hourly and daily forecasts count days in UTC, sun times in local time
+        now = datetime.datetime.now(tz=datetime.UTC)
+        return now.date(), now.astimezone(TimeUtils.get_local_timezone()).date()
+
+    async def _fetch_pages(
+        self, urls: tuple[str, ...], parse_day: _ParseDay
+    ) -> dict[str, PageResponse | BaseException]:
+        """
+        Fetch pages concurrently under one shared timeout budget.
+
+        Pages that fail or miss the deadline map to their exception, so the
+        pages that did arrive can still be parsed. Pages parsed earlier on
+        parse_day are requested conditionally using their cached validators;
+        data parsed on another day holds stale dates and is fetched again.
+        """
+        tasks = {}
+        for url in urls:
+            etag = last_modified = None
+            cached = self._page_cache.get(url)
+            if cached is not None and cached[0] == parse_day:
+                _, etag, last_modified, _ = cached
+            tasks[url] = asyncio.ensure_future(
+                self._http_client.get_page(
+                    url,
+                    request_timeout=None,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+            )
         try:
-            # Use backward compatibility methods for test compatibility
-            results = await asyncio.gather(
-                self._scrape_current_weather(urls[0]),
-                self._scrape_hourly_forecast(urls[1]),
-                self._scrape_daily_forecast(urls[2]),
-                self._scrape_alerts(urls[1]),  # Alerts are on hourly forecast page
-                return_exceptions=True,
+            _, pending = await asyncio.wait(
+                tasks.values(), timeout=IdokepConfig.TOTAL_TIMEOUT
             )
+        finally:
+            # No-op for finished tasks; also cleans up if we are cancelled
+            for task in tasks.values():
+                task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        pages: dict[str, PageResponse | BaseException] = {}
+        for url, task in tasks.items():
+            if task in pending:
+                pages[url] = TimeoutError(f"Timeout error fetching {url}")
+            else:
+                pages[url] = task.exception() or task.result()
+        return pages
 
-            # Combine results, handling both successful data and exceptions
-            data = {}
-            for result in results:
-                if isinstance(result, dict):
-                    data.update(result)
-                elif isinstance(result, Exception):
-                    LOGGER.warning("Failed to scrape some weather data: %s", result)
-        except (aiohttp.ClientError, TimeoutError, socket.gaierror) as exc:
-            LOGGER.error("Error scraping Idokep: %s", exc)
-            return {}
+    @staticmethod
+    def _is_connectivity_failure(exc: BaseException) -> bool:
+        """Tell whether a fetch failed to reach the host rather than got an error."""
+        if isinstance(exc, TimeoutError):
+            return True
+        # ClientConnectionError covers refused/reset connections; OSError covers
+        # DNS (socket.gaierror) and unreachable networks
+        return isinstance(exc.__cause__, (aiohttp.ClientConnectionError, OSError))
+
+    @staticmethod
+    def _make_strainer(*parsers: WeatherParser) -> SoupStrainer | None:
+        """Build a strainer keeping only the divs the given parsers read."""
+        classes: set[str] = set()
+        for parser in parsers:
+            if parser.STRAINER_CLASSES is None:
+                return None
+            classes.update(parser.STRAINER_CLASSES)
+
+        def _has_class(value: str | None) -> bool:
+            # While parsing, the class attribute is still the raw string
+            return value is not None and not classes.isdisjoint(value.split())
+
+        return SoupStrainer("div", class_=_has_class)
+
+    @classmethod
+    def _parse_page(
+        cls, html: bytes, *parsers: WeatherParser, encoding: str | None = None
+    ) -> dict[str, Any]:
+        """
+        Build the soup for a fetched page once and run each parser on it.
+
+        Without an encoding the parser detects it from the page itself.
+        """
+        soup = BeautifulSoup(
+            html,
+            _HTML_PARSER,
+            parse_only=cls._make_strainer(*parsers),
+            from_encoding=encoding,
+        )
+        data: dict[str, Any] = {}
+        for parser in parsers:
+            data.update(parser.parse(soup))
         return data
 
     async def _scrape_and_parse(
@@ -932,65 +1366,34 @@ class IdokepApiClient:
         """Scrape URL and parse with given parser."""
         try:
             html = await self._http_client.get_html(url)
-            soup = BeautifulSoup(html, "html.parser")
-            return parser.parse(soup)
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            socket.gaierror,
-            IdokepApiClientCommunicationError,
-        ) as exc:
+            return self._parse_page(html, parser)
+        except _SCRAPE_ERRORS as exc:
             LOGGER.error("Error scraping %s: %s", url, exc)
             return {}
 
+    async def _scrape_or_empty(self, url: str, parser: WeatherParser) -> dict[str, Any]:
+        """Scrape URL with the given parser, returning {} on fetch errors."""
+        try:
+            return await self._scrape_and_parse(url, parser)
+        except _SCRAPE_ERRORS:
+            return {}
+
     # Backward compatibility scrape methods for tests
     async def _scrape_current_weather(self, url: str) -> dict[str, Any]:
         """Scrape current weather data."""
-        try:
-            return await self._scrape_and_parse(url, self._current_parser)
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            socket.gaierror,
-            IdokepApiClientCommunicationError,
-        ):
-            return {}
+        return await self._scrape_or_empty(url, self._current_parser)
 
     async def _scrape_hourly_forecast(self, url: str) -> dict[str, Any]:
         """Scrape hourly forecast data."""
-        try:
-            return await self._scrape_and_parse(url, self._hourly_parser)
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            socket.gaierror,
-            IdokepApiClientCommunicationError,
-        ):
-            return {}
+        return await self._scrape_or_empty(url, self._hourly_parser)
 
     async def _scrape_daily_forecast(self, url: str) -> dict[str, Any]:
         """Scrape daily forecast data."""
-        try:
-            return await self._scrape_and_parse(url, self._daily_parser)
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            socket.gaierror,
-            IdokepApiClientCommunicationError,
-        ):
-            return {}
+        return await self._scrape_or_empty(url, self._daily_parser)
 
     async def _scrape_alerts(self, url: str) -> dict[str, Any]:
         """Scrape weather alerts from hourly forecast page."""
-        try:
-            return await self._scrape_and_parse(url, self._alert_parser)
-        except (
-            aiohttp.ClientError,
-            TimeoutError,
-            socket.gaierror,
-            IdokepApiClientCommunicationError,
-        ):
-            return {}
+        return await self._scrape_or_empty(url, self._alert_parser)
 
     @property
     def _session(self) -> aiohttp.ClientSession:
@@ -1105,7 +1508,26 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
-# Factory function for easy creation
-def create_idokep_client(session: aiohttp.ClientSession) -> IdokepApiClient:
-    """Create an IdokepApiClient instance."""
+# Factory functions for easy creation
+def create_idokep_session() -> aiohttp.ClientSession:
+    """Create a client session tuned for keep-alive reuse across page fetches."""
+    connector = aiohttp.TCPConnector(
+        limit=IdokepConfig.CONNECTION_LIMIT,
+        limit_per_host=IdokepConfig.CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=IdokepConfig.DNS_CACHE_TTL,
+        keepalive_timeout=IdokepConfig.KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def create_idokep_client(
+    session: aiohttp.ClientSession | None = None,
+) -> IdokepApiClient:
+    """
+    Create an IdokepApiClient instance.
+
+    Without a session the client creates a tuned one and closes it in
+    IdokepApiClient.close(); this needs a running event loop, so call the
+    factory from a coroutine.
+    """
     return IdokepApiClient(session)
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import datetime
-from typing import TYPE_CHECKING
+import functools
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -14,6 +17,8 @@ from homeassistant.components.binary_sensor import (
 from .entity import IdokepEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -58,6 +63,14 @@ ENTITY_DESCRIPTIONS = (
     ),
 )
 
+ALERT_LEVEL_KEYS = frozenset(("alert_yellow", "alert_orange", "alert_red"))
+
+# Read-only attributes shared by every sensor while nothing is to report
+_NO_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+_NO_LEVEL_ALERT_ATTRIBUTES: Mapping[str, Any] = MappingProxyType(
+    {"alert_count": 0, "alerts": ()}
+)
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -94,31 +107,49 @@ class IdokepBinarySensor(IdokepEntity, BinarySensorEntity):
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
+        # Storm times parsed from the hourly forecast list last seen, so the
+        # datetimes are parsed once per update rather than on every state read
+        self._storm_forecast: list[dict] | None = None
+        self._storm_times: list[float] = []
+        # Alert attributes built from the alert lists last seen
+        self._alerts_source: tuple[list, dict] | None = None
+        self._alerts_attributes: dict = {}
+        # Level of the alert_<level> sensors, None for the other sensors
+        key = entity_description.key
+        self._alert_level = (
+            key.removeprefix("alert_") if key in ALERT_LEVEL_KEYS else None
+        )
+
+        # The key never changes, so pick the state and attribute getters once
+        check_method = self._CHECK_METHODS.get(key)
+        self._is_on_impl: Callable[[], bool]
+        self._attrs_impl: Callable[[], Mapping[str, Any]]
+        if check_method:
+            self._is_on_impl = functools.partial(check_method, self)
+        elif self._alert_level:
+            self._is_on_impl = functools.partial(
+                self._check_alert_level, self._alert_level
+            )
+        else:
+            self._is_on_impl = lambda: False
+        if key == "weather_alert":
+            self._attrs_impl = self._get_all_alerts_attributes
+        elif self._alert_level:
+            self._attrs_impl = functools.partial(
+                self._get_level_alert_attributes, self._alert_level
+            )
+        else:
+            self._attrs_impl = lambda: _NO_ATTRIBUTES
 
     @property
     def is_on(self) -> bool:
         """Return true if the binary_sensor is on."""
-        check_methods = {
-            "storm_expected_1h": self._check_storm_expected_next_hour,
-            "idokep_connectivity": self._check_data_fresh,
-            "weather_alert": self._check_any_alert,
-            "alert_yellow": lambda: self._check_alert_level("yellow"),
-            "alert_orange": lambda: self._check_alert_level("orange"),
-            "alert_red": lambda: self._check_alert_level("red"),
-        }
-
-        check_method = check_methods.get(self.entity_description.key)
-        return check_method() if check_method else False
+        return self._is_on_impl()
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes for alert sensors."""
-        if self.entity_description.key == "weather_alert":
-            return self._get_all_alerts_attributes()
-        if self.entity_description.key in ("alert_yellow", "alert_orange", "alert_red"):
-            level = self.entity_description.key.replace("alert_", "")
-            return self._get_level_alert_attributes(level)
-        return {}
+        return self._attrs_impl()
 
     def _check_data_fresh(self) -> bool:
         """Check if data is fresh and API updated successfully."""
@@ -127,52 +158,83 @@ class IdokepBinarySensor(IdokepEntity, BinarySensorEntity):
             return False
 
         # Check if we have actual data
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return False
 
         # Check essential data fields are present
-        essential_fields = ["temperature", "condition"]
-        return all(field in self.coordinator.data for field in essential_fields)
+        return "temperature" in data and "condition" in data
 
     def _check_storm_expected_next_hour(self) -> bool:
         """Check if storm is expected in the next hour."""
-        now = datetime.datetime.now(datetime.UTC)
-        next_hour = now + datetime.timedelta(hours=1)
-
-        for forecast in self.coordinator.data.get("hourly_forecast", []):
-            if forecast.get("condition") and "Zivatar" in forecast.get("condition", ""):
-                try:
-                    forecast_dt = datetime.datetime.fromisoformat(
-                        forecast.get("datetime", "")
-                    )
-                    # Make timezone-aware if needed
-                    if forecast_dt.tzinfo is None:
-                        forecast_dt = forecast_dt.replace(tzinfo=datetime.UTC)
-
-                    # Check if forecast is within the next hour
-                    if now <= forecast_dt <= next_hour:
-                        return True
-                except (ValueError, TypeError):
-                    # Skip invalid datetime entries
-                    continue
-        return False
+        # POSIX timestamps compare as plain floats, without tzinfo handling
+        now = time.time()
+        next_hour = now + 3600.0
+
+        # Check if any storm forecast is within the next hour
+        return any(
+            now <= storm_time <= next_hour for storm_time in self._get_storm_times()
+        )
+
+    def _get_storm_times(self) -> list[float]:
+        """Return the storm forecast times, parsing each forecast list once."""
+        hourly_forecast = (self.coordinator.data or {}).get("hourly_forecast", [])
+        if hourly_forecast is not self._storm_forecast:
+            self._storm_forecast = hourly_forecast
+            self._storm_times = self._parse_storm_times(hourly_forecast)
+        return self._storm_times
+
+    @staticmethod
+    def _parse_storm_times(hourly_forecast: list[dict]) -> list[float]:
+        """Parse the storm entries of a forecast into POSIX timestamps."""
+        storm_times = []
+        for forecast in hourly_forecast:
+            condition = forecast.get("condition")
+            if not condition or "Zivatar" not in condition:
+                continue
+            try:
+                forecast_dt = datetime.datetime.fromisoformat(
+                    forecast.get("datetime", "")
+                )
+            except (ValueError, TypeError):
+                # Skip invalid datetime entries
+                continue
+            # Make timezone-aware if needed
+            if forecast_dt.tzinfo is None:
+                forecast_dt = forecast_dt.replace(tzinfo=datetime.UTC)
+            storm_times.append(forecast_dt.timestamp())
+        return storm_times
 
     def _check_any_alert(self) -> bool:
         """Check if any weather alert is active."""
-        alerts = self.coordinator.data.get("alerts", [])
-        return len(alerts) > 0
+        return bool((self.coordinator.data or {}).get("alerts"))
 
     def _check_alert_level(self, level: str) -> bool:
         """Check if alerts of specific level are active."""
-        alerts_by_level = self.coordinator.data.get("alerts_by_level", {})
-        level_alerts = alerts_by_level.get(level, [])
-        return len(level_alerts) > 0
+        alerts_by_level = (self.coordinator.data or {}).get("alerts_by_level", {})
+        return bool(alerts_by_level.get(level))
 
     def _get_all_alerts_attributes(self) -> dict:
-        """Get attributes for all alerts."""
-        alerts = self.coordinator.data.get("alerts", [])
-        alerts_by_level = self.coordinator.data.get("alerts_by_level", {})
+        """Get attributes for all alerts, rebuilt only when the alerts change."""
+        data = self.coordinator.data or {}
+        alerts = data.get("alerts", [])
+        alerts_by_level = data.get("alerts_by_level", {})
+
+        source = self._alerts_source
+        if (
+            source is None
+            or source[0] is not alerts
+            or source[1] is not alerts_by_level
+        ):
+            self._alerts_source = (alerts, alerts_by_level)
+            self._alerts_attributes = self._build_alerts_attributes(
+                alerts, alerts_by_level
+            )
+        return self._alerts_attributes
 
+    @staticmethod
+    def _build_alerts_attributes(alerts: list, alerts_by_level: dict) -> dict:
+        """Build the attributes for all alerts."""
         return {
             "alert_count": len(alerts),
             "yellow_alerts": len(alerts_by_level.get("yellow", [])),
@@ -189,12 +251,22 @@ class IdokepBinarySensor(IdokepEntity, BinarySensorEntity):
             ],
         }
 
-    def _get_level_alert_attributes(self, level: str) -> dict:
+    def _get_level_alert_attributes(self, level: str) -> Mapping[str, Any]:
         """Get attributes for specific alert level."""
-        alerts_by_level = self.coordinator.data.get("alerts_by_level", {})
-        level_alerts = alerts_by_level.get(level, [])
+        alerts_by_level = (self.coordinator.data or {}).get("alerts_by_level", {})
+        level_alerts = alerts_by_level.get(level)
+        if not level_alerts:
+            # The common case: no alert of this level is active
+            return _NO_LEVEL_ALERT_ATTRIBUTES
 
         return {
             "alert_count": len(level_alerts),
             "alerts": level_alerts,
         }
+
+    # is_on checks by entity key; the alert_<level> sensors use _alert_level
+    _CHECK_METHODS: ClassVar[dict[str, Callable[[IdokepBinarySensor], bool]]] = {
+        "storm_expected_1h": _check_storm_expected_next_hour,
+        "idokep_connectivity": _check_data_fresh,
+        "weather_alert": _check_any_alert,
+    }
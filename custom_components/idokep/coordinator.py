@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import IdokepApiClientConnectivityError
@@ -23,7 +25,12 @@ class NoWeatherDataError(Exception):
 
     def __init__(self, location: str) -> None:
         """Initialize NoWeatherDataError with the given location."""
-        super().__init__(f"No weather data found for location: {location}")
+        super().__init__(location)
+        self.location = location
+
+    def __str__(self) -> str:
+        """Return the message, formatted only when it is needed."""
+        return f"No weather data found for location: {self.location}"
 
 
 class IdokepDataUpdateCoordinator(DataUpdateCoordinator):
@@ -45,6 +52,19 @@ class IdokepDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.config_entry = config_entry
 
+    @functools.cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return the device info shared by all entities of this entry."""
+        return DeviceInfo(
+            identifiers={
+                (
+                    self.config_entry.domain,
+                    self.config_entry.entry_id,
+                ),
+            },
+            name="Időkép",
+        )
+
     async def _async_update_data(self) -> dict:
         """Update data via library."""
         location = self.config_entry.data["location"]
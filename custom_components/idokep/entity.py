@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTRIBUTION
@@ -17,12 +16,5 @@ class IdokepEntity(CoordinatorEntity[IdokepDataUpdateCoordinator]):
     def __init__(self, coordinator: IdokepDataUpdateCoordinator) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={
-                (
-                    coordinator.config_entry.domain,
-                    coordinator.config_entry.entry_id,
-                ),
-            },
-            name="Időkép",  # Add device name
-        )
+        # One DeviceInfo per config entry, shared by all of its entities
+        self._attr_device_info = coordinator.device_info
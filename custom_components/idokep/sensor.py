@@ -93,6 +93,10 @@ class IdokepSensor(IdokepEntity, SensorEntity):
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
+        # Last timestamp string seen and its parsed value, so the string is
+        # parsed once per change rather than on every state read
+        self._timestamp_source: str | None = None
+        self._timestamp: datetime | None = None
 
     @property
     def native_value(self) -> str | int | float | datetime | None:
@@ -102,8 +106,11 @@ class IdokepSensor(IdokepEntity, SensorEntity):
             self.entity_description.device_class == SensorDeviceClass.TIMESTAMP
             and isinstance(value, str)
         ):
-            try:
-                return datetime.fromisoformat(value)
-            except ValueError:
-                return None
+            if value != self._timestamp_source:
+                self._timestamp_source = value
+                try:
+                    self._timestamp = datetime.fromisoformat(value)
+                except ValueError:
+                    self._timestamp = None
+            return self._timestamp
         return value
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import socket
 import zoneinfo
@@ -23,8 +24,12 @@ from custom_components.idokep.api import (
     IdokepApiClientCommunicationError,
     IdokepApiClientConnectivityError,
     IdokepApiClientError,
+    IdokepConfig,
+    PageResponse,
+    TimeUtils,
     _verify_response_or_raise,
     create_idokep_client,
+    create_idokep_session,
 )
 
 
@@ -308,14 +313,20 @@ class TestIdokepApiClient:
         self,
         api_client: IdokepApiClient,
     ) -> None:
-        """Test async_get_weather_data when there's no connectivity."""
+        """Every page failing to connect is reported as a connectivity error."""
+        error = IdokepApiClientCommunicationError("Error fetching")
+        error.__cause__ = socket.gaierror("DNS error")
+
         with (
-            patch.object(api_client, "check_connectivity", return_value=False),
+            patch.object(api_client._http_client, "get_page", side_effect=error),
+            patch.object(api_client, "check_connectivity") as mock_check,
             pytest.raises(IdokepApiClientConnectivityError) as exc_info,
         ):
             await api_client.async_get_weather_data("test_location")
 
         assert "No internet connectivity" in str(exc_info.value)
+        # The failed page fetches replace the old preflight request
+        mock_check.assert_not_called()
 
 
 class TestIdokepApiClientWeatherScraping:
@@ -471,7 +482,11 @@ class TestIdokepApiClientWeatherScraping:
         """Test successful current weather scraping."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
-        mock_response.text = AsyncMock(return_value=sample_current_weather_html)
+        mock_response.content_length = None
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(
+            side_effect=[sample_current_weather_html.encode(), b""]
+        )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -518,7 +533,11 @@ class TestIdokepApiClientWeatherScraping:
         """Test successful hourly forecast scraping with 36 hours."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
-        mock_response.text = AsyncMock(return_value=sample_hourly_forecast_html)
+        mock_response.content_length = None
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(
+            side_effect=[sample_hourly_forecast_html.encode(), b""]
+        )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -634,7 +653,9 @@ class TestIdokepApiClientWeatherScraping:
 
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
-        mock_response.text = AsyncMock(return_value=html)
+        mock_response.content_length = None
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(side_effect=[html.encode(), b""])
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -671,7 +692,11 @@ class TestIdokepApiClientWeatherScraping:
         """Test successful daily forecast scraping."""
         mock_response = AsyncMock()
         mock_response.raise_for_status = Mock()
-        mock_response.text = AsyncMock(return_value=sample_daily_forecast_html)
+        mock_response.content_length = None
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(
+            side_effect=[sample_daily_forecast_html.encode(), b""]
+        )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -720,43 +745,39 @@ class TestIdokepApiClientWeatherScraping:
 
         assert result == {}
 
+    @pytest.fixture
+    def pages(
+        self,
+        sample_current_weather_html: str,
+        sample_hourly_forecast_html: str,
+        sample_daily_forecast_html: str,
+    ) -> dict[str, bytes]:
+        """Map the Budapest page URLs to their sample HTML."""
+        return {
+            IdokepConfig.get_current_weather_url("budapest"): (
+                sample_current_weather_html.encode()
+            ),
+            IdokepConfig.get_hourly_forecast_url("budapest"): (
+                sample_hourly_forecast_html.encode()
+            ),
+            IdokepConfig.get_daily_forecast_url("budapest"): (
+                sample_daily_forecast_html.encode()
+            ),
+        }
+
     @pytest.mark.asyncio
     async def test_async_get_weather_data_success(
-        self, api_client: IdokepApiClient
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
     ) -> None:
         """Test complete weather data retrieval."""
-        # Mock all three scraping methods
-        current_data = {
-            "temperature": 22,
-            "condition": "sunny",
-            "precipitation": 2,
-            "precipitation_probability": 30,
-        }
-        hourly_data = {
-            "hourly_forecast": [{"datetime": "2024-01-15T14:00:00", "temperature": 25}]
-        }
-        daily_data = {"daily_forecast": [{"datetime": "2024-01-15", "temperature": 25}]}
+
+        async def get_page(url: str, **_kwargs: object) -> PageResponse:
+            return PageResponse(pages[url])
 
         with (
-            patch.object(api_client, "check_connectivity", return_value=True),
-            patch.object(
-                api_client,
-                "_scrape_current_weather",
-                new_callable=AsyncMock,
-                return_value=current_data,
-            ),
-            patch.object(
-                api_client,
-                "_scrape_hourly_forecast",
-                new_callable=AsyncMock,
-                return_value=hourly_data,
-            ),
             patch.object(
-                api_client,
-                "_scrape_daily_forecast",
-                new_callable=AsyncMock,
-                return_value=daily_data,
-            ),
+                api_client._http_client, "get_page", side_effect=get_page
+            ) as mock_get_page,
         ):
             result = await api_client.async_get_weather_data("budapest")
 
@@ -765,91 +786,217 @@ class TestIdokepApiClientWeatherScraping:
         assert result["condition"] == "sunny"
         assert "hourly_forecast" in result
         assert "daily_forecast" in result
+        assert "alerts" in result
+        # The hourly page feeds both hourly forecast and alerts but is fetched once
+        assert mock_get_page.await_count == 3
 
     @pytest.mark.asyncio
     async def test_async_get_weather_data_partial_failure(
-        self, api_client: IdokepApiClient
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
     ) -> None:
-        """Test weather data retrieval with some methods failing."""
-        current_data = {"temperature": 22, "condition": "sunny"}
+        """Test weather data retrieval with some pages failing."""
+        hourly_url = IdokepConfig.get_hourly_forecast_url("budapest")
+
+        async def get_page(url: str, **_kwargs: object) -> PageResponse:
+            if url == hourly_url:
+                msg = "Network error"
+                raise IdokepApiClientCommunicationError(msg)
+            return PageResponse(pages[url])
 
         with (
-            patch.object(api_client, "check_connectivity", return_value=True),
-            patch.object(
-                api_client,
-                "_scrape_current_weather",
-                new_callable=AsyncMock,
-                return_value=current_data,
-            ),
-            patch.object(
-                api_client,
-                "_scrape_hourly_forecast",
-                new_callable=AsyncMock,
-                side_effect=Exception("Network error"),
-            ),
-            patch.object(
-                api_client,
-                "_scrape_daily_forecast",
-                new_callable=AsyncMock,
-                return_value={},
-            ),
+            patch.object(api_client._http_client, "get_page", side_effect=get_page),
         ):
             result = await api_client.async_get_weather_data("budapest")
 
-        # Should still return current data even if others fail
+        # Should still return the other pages' data even if one fails
         assert result["temperature"] == 22
         assert result["condition"] == "sunny"
+        assert "daily_forecast" in result
+        assert "hourly_forecast" not in result
+        assert "alerts" not in result
 
     @pytest.mark.asyncio
     async def test_async_get_weather_data_with_exception_results(
-        self, api_client: IdokepApiClient
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
     ) -> None:
-        """Test async_get_weather_data when some results are exceptions."""
-        # This tests lines 142-145 (handling Exception results)
-        current_data = {"temperature": 22, "condition": "sunny"}
+        """A page whose parser raises is dropped, the other pages are kept."""
 
-        # Create a proper async mock that returns the list with exceptions
-        async def mock_gather(*_args: object, **_kwargs: object) -> list:
-            return [
-                current_data,
-                Exception("Network error"),
-                {"hourly_forecast": []},
-            ]
+        async def get_page(url: str, **_kwargs: object) -> PageResponse:
+            return PageResponse(pages[url])
 
         with (
-            patch.object(api_client, "check_connectivity", return_value=True),
-            patch(
-                "custom_components.idokep.api.asyncio.gather", side_effect=mock_gather
+            patch.object(api_client._http_client, "get_page", side_effect=get_page),
+            patch.object(
+                api_client._current_parser,
+                "parse",
+                side_effect=ValueError("hour must be in 0..23"),
             ),
         ):
             result = await api_client.async_get_weather_data("budapest")
 
-        # Should include data from successful results
+        # Should include data from the pages that parsed
+        assert "temperature" not in result
+        assert "hourly_forecast" in result
+        assert "daily_forecast" in result
+        assert "alerts" in result
+
+    @pytest.mark.asyncio
+    async def test_async_get_weather_data_slow_page_times_out(
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
+    ) -> None:
+        """Pages missing the shared deadline are dropped, the rest are kept."""
+        daily_url = IdokepConfig.get_daily_forecast_url("budapest")
+        never = asyncio.Event()
+
+        async def get_page(url: str, **_kwargs: object) -> PageResponse:
+            if url == daily_url:
+                await never.wait()
+            return PageResponse(pages[url])
+
+        with (
+            patch.object(api_client._http_client, "get_page", side_effect=get_page),
+            patch.object(IdokepConfig, "TOTAL_TIMEOUT", 0.05),
+        ):
+            result = await api_client.async_get_weather_data("budapest")
+
         assert result["temperature"] == 22
-        assert result["condition"] == "sunny"
         assert "hourly_forecast" in result
+        assert "daily_forecast" not in result
+
+    @pytest.mark.asyncio
+    async def test_async_get_weather_data_reuses_unchanged_pages(
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
+    ) -> None:
+        """A 304 Not Modified reuses the data parsed from the cached page."""
+        current_url = IdokepConfig.get_current_weather_url("budapest")
+        parsed_once = AsyncMock(
+            side_effect=lambda url, **_kwargs: PageResponse(pages[url], etag=f'"{url}"')
+        )
+        not_modified = AsyncMock(
+            side_effect=lambda _url, **kwargs: PageResponse(None, kwargs["etag"])
+        )
+
+        with patch.object(api_client._http_client, "get_page", parsed_once):
+            first = await api_client.async_get_weather_data("budapest")
+        with (
+            patch.object(api_client._http_client, "get_page", not_modified),
+            patch.object(api_client, "_parse_page") as mock_parse,
+        ):
+            second = await api_client.async_get_weather_data("budapest")
+
+        assert second == first
+        mock_parse.assert_not_called()
+        not_modified.assert_any_await(
+            current_url,
+            request_timeout=None,
+            etag=f'"{current_url}"',
+            last_modified=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_async_get_weather_data_refetches_pages_on_new_day(
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
+    ) -> None:
+        """Pages parsed on an earlier day are fetched again without validators."""
+        current_url = IdokepConfig.get_current_weather_url("budapest")
+        yesterday = (dt.date(2025, 6, 1), dt.date(2025, 6, 1))
+        today = (dt.date(2025, 6, 2), dt.date(2025, 6, 2))
+        get_page = AsyncMock(
+            side_effect=lambda url, **kwargs: (
+                PageResponse(None, kwargs["etag"])
+                if kwargs["etag"]
+                else PageResponse(pages[url], etag=f'"{url}"')
+            )
+        )
+
+        with patch.object(api_client._http_client, "get_page", get_page):
+            with patch.object(IdokepApiClient, "_parse_day", return_value=yesterday):
+                await api_client.async_get_weather_data("budapest")
+            with (
+                patch.object(IdokepApiClient, "_parse_day", return_value=today),
+                patch.object(api_client, "_parse_page", return_value={}) as mock_parse,
+            ):
+                await api_client.async_get_weather_data("budapest")
+
+        # Every page is parsed again, so the dates in the data are today's
+        assert mock_parse.call_count == 3
+        get_page.assert_awaited_with(
+            IdokepConfig.get_daily_forecast_url("budapest"),
+            request_timeout=None,
+            etag=None,
+            last_modified=None,
+        )
+        assert api_client._page_cache[current_url][0] == today
+
+    @pytest.mark.asyncio
+    async def test_async_get_weather_data_drops_validators_without_cache_headers(
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
+    ) -> None:
+        """A full response without validators clears the previous ones."""
+        with patch.object(
+            api_client._http_client,
+            "get_page",
+            side_effect=lambda url, **_kwargs: PageResponse(pages[url], etag='"v1"'),
+        ):
+            await api_client.async_get_weather_data("budapest")
+        with patch.object(
+            api_client._http_client,
+            "get_page",
+            side_effect=lambda url, **_kwargs: PageResponse(pages[url]),
+        ):
+            await api_client.async_get_weather_data("budapest")
+
+        assert api_client._page_cache == {}
 
     @pytest.mark.asyncio
-    async def test_async_get_weather_data_top_level_exception(
+    async def test_async_get_weather_data_all_pages_fail(
         self, api_client: IdokepApiClient
     ) -> None:
-        """Test async_get_weather_data when asyncio.gather itself fails."""
-        # This tests lines 147-148 (top-level exception handling)
+        """Test async_get_weather_data when every fetch fails."""
         with (
-            patch.object(api_client, "check_connectivity", return_value=True),
-            patch(
-                "custom_components.idokep.api.asyncio.gather",
-                side_effect=aiohttp.ClientError("Network failure"),
+            patch.object(
+                api_client._http_client,
+                "get_page",
+                side_effect=IdokepApiClientCommunicationError("Network failure"),
             ),
-            patch.object(api_client, "_scrape_current_weather", new_callable=AsyncMock),
-            patch.object(api_client, "_scrape_hourly_forecast", new_callable=AsyncMock),
-            patch.object(api_client, "_scrape_daily_forecast", new_callable=AsyncMock),
         ):
             result = await api_client.async_get_weather_data("budapest")
 
-        # Should return empty dict when gather fails
+        # Should return empty dict when nothing could be fetched
         assert result == {}
 
+    @pytest.mark.asyncio
+    async def test_async_get_weather_data_coalesces_concurrent_calls(
+        self, api_client: IdokepApiClient, pages: dict[str, bytes]
+    ) -> None:
+        """Concurrent calls for one location share a single fetch."""
+
+        async def get_page(url: str, **_kwargs: object) -> PageResponse:
+            await asyncio.sleep(0)
+            return PageResponse(pages[url])
+
+        with patch.object(
+            api_client._http_client, "get_page", side_effect=get_page
+        ) as mock_get_page:
+            first, second = await asyncio.gather(
+                api_client.async_get_weather_data("budapest"),
+                api_client.async_get_weather_data("budapest"),
+            )
+            assert first == second
+            assert mock_get_page.await_count == 3
+
+            # A later call starts a new update
+            await api_client.async_get_weather_data("budapest")
+            assert mock_get_page.await_count == 6
+
+    def test_parse_page_uses_given_encoding(self) -> None:
+        """The charset from the response header decodes the page bytes."""
+        html = '<div class="ik current-weather">zápor</div>'.encode("iso-8859-2")
+        result = IdokepApiClient._parse_page(
+            html, CurrentWeatherParser(), encoding="iso-8859-2"
+        )
+        assert result["condition"] == "rainy"
+
     def test_parse_sunrise_sunset(self, api_client: IdokepApiClient) -> None:
         """Test sunrise and sunset parsing."""
         html = """
@@ -1123,6 +1270,33 @@ class TestSunriseSunsetRegression:
         # Should return empty dict when no data found
         assert result == {}
 
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Napkelte 6:18", "06:18"),
+            ("Napkelte: 6:18", "06:18"),
+            ("Napkelte\n  07:05 ", "07:05"),
+            ("Napkelte\u20036:18", "06:18"),
+            ("NapkelteNapkelte6:18", "06:18"),
+            ("Napkelte ma, Napkelte: 6:18", "06:18"),
+            ("Napkelte", None),
+            ("Napkelte 6", None),
+            ("Napkelte 6:1", None),
+            ("Napnyugta 19:45", None),
+        ],
+    )
+    def test_extract_time_from_text_formats(
+        self, text: str, expected: str | None
+    ) -> None:
+        """The time right after the label is read; anything else yields None."""
+        result = TimeUtils.extract_time_from_text(
+            "Napkelte", text, dt.date(2025, 6, 1), dt.UTC
+        )
+        if expected is None:
+            assert result is None
+        else:
+            assert result == f"2025-06-01T{expected}:00+00:00"
+
 
 # ---------------------------------------------------------------------------
 # AlertParser tests
@@ -1513,6 +1687,56 @@ class TestHourlyParserBranches:
         result = parser._parse_hourly_card(card, hour_div, dt.date(2025, 6, 1))
         assert result is None
 
+    @pytest.mark.parametrize(
+        ("hour_text", "expected"),
+        [
+            ("7:05", "2025-06-01T07:05:00"),
+            ("23", "2025-06-01T23:00:00"),
+            ("25:00", None),
+            ("12:60", None),
+        ],
+    )
+    def test_parse_hourly_card_datetime_format(
+        self, parser: HourlyForecastParser, hour_text: str, expected: str | None
+    ) -> None:
+        """The ISO datetime matches datetime.isoformat(); bad times give None."""
+        html = f"""
+        <div class="ik wide-hourly-forecast-card">
+            <div class="ik wide-hourly-forecast-hour">{hour_text}</div>
+            <div class="ik tempValue"><a>20</a></div>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        card = soup.find("div", class_="ik wide-hourly-forecast-card")
+        hour_div = card.find("div", class_="ik wide-hourly-forecast-hour")
+        result = parser._parse_hourly_card(card, hour_div, dt.date(2025, 6, 1))
+        if expected is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result["datetime"] == expected
+
+    @pytest.mark.parametrize(
+        ("temp_text", "expected"),
+        [("20", 20), ("-3", -3), ("+3", 3), (" 7 ", 7), ("n/a", None)],
+    )
+    def test_parse_hourly_card_temperature(
+        self, parser: HourlyForecastParser, temp_text: str, expected: int | None
+    ) -> None:
+        """Temperatures parse like int(); unparsable text gives None."""
+        html = f"""
+        <div class="ik wide-hourly-forecast-card">
+            <div class="ik wide-hourly-forecast-hour">12:00</div>
+            <div class="ik tempValue"><a>{temp_text}</a></div>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        card = soup.find("div", class_="ik wide-hourly-forecast-card")
+        hour_div = card.find("div", class_="ik wide-hourly-forecast-hour")
+        result = parser._parse_hourly_card(card, hour_div, dt.date(2025, 6, 1))
+        assert result is not None
+        assert result["temperature"] == expected
+
     # ---- extract_precipitation_probability ---------------------------------
 
     def test_precipitation_probability_no_rain_chance_div(
@@ -1703,6 +1927,34 @@ class TestDailyParserBranches:
         # napos → sunny
         assert result == "sunny"
 
+    @pytest.mark.parametrize(
+        ("popover", "expected"),
+        [
+            # An alt on a later icon beats text after an earlier icon
+            (
+                "&lt;img src='forecastIcons/a.svg'&gt;napos"
+                "&lt;img src='forecastIcons/b.svg' alt='eső'&gt;",
+                "rainy",
+            ),
+            # A blank alt falls through to the text after the icon
+            ("&lt;img src='forecastIcons/a.svg' alt=' '&gt;napos", "sunny"),
+        ],
+    )
+    def test_extract_condition_alt_precedence(
+        self, parser: DailyForecastParser, popover: str, expected: str
+    ) -> None:
+        """A non-blank alt anywhere wins; otherwise the icon text is used."""
+        html = f"""
+        <div class="col">
+            <div class="ik dfIconAlert">
+                <a data-bs-content="{popover}">icon</a>
+            </div>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        col = soup.find("div", class_="col")
+        assert parser.extract_condition(col) == expected
+
     def test_extract_condition_no_match_returns_none(
         self, parser: DailyForecastParser
     ) -> None:
@@ -1790,6 +2042,36 @@ class TestDailyParserBranches:
         result = parser.extract_precipitation_probability(col)
         assert result == 0
 
+    # ---- _parse_daily_column -----------------------------------------------
+
+    def test_parse_daily_column_reads_all_fields_in_one_walk(
+        self, parser: DailyForecastParser
+    ) -> None:
+        """Every field is picked from the same column walk, first match wins."""
+        html = """
+        <div class="ik dailyForecastCol">
+            <div class="ik dfIconAlert">
+                <a data-bs-content="<img src='/forecastIcons/x.svg' alt='zápor'>"></a>
+            </div>
+            <div class="ik max"><a>21</a></div>
+            <div class="ik min"><a>9</a></div>
+            <div class="ik min"><a>-3</a></div>
+            <span class="ik mm">4 mm</span>
+            <div><a>60%</a></div>
+        </div>
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        col = soup.find("div", class_="dailyForecastCol")
+        result = parser._parse_daily_column(col, dt.date(2025, 7, 1))
+        assert result == {
+            "datetime": "2025-07-01",
+            "temperature": 21,
+            "templow": 9,
+            "condition": "rainy",
+            "precipitation": 4,
+            "precipitation_probability": 60,
+        }
+
 
 # ---------------------------------------------------------------------------
 # IdokepApiClient compatibility wrapper tests
@@ -1903,6 +2185,47 @@ class TestCreateIdokepClientFactory:
         client = create_idokep_client(mock_session)
         assert isinstance(client, IdokepApiClient)
 
+    @pytest.mark.asyncio
+    async def test_factory_without_session_uses_tuned_session(self) -> None:
+        """create_idokep_client builds a pooled session when none is given."""
+        async with create_idokep_client() as client:
+            session = client._http_client.session
+            assert isinstance(session.connector, aiohttp.TCPConnector)
+            assert (
+                session.connector.limit_per_host
+                == IdokepConfig.CONNECTION_LIMIT_PER_HOST
+            )
+
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_close_leaves_passed_in_session_open(self) -> None:
+        """close() only closes a session the client created itself."""
+        session = create_idokep_session()
+        try:
+            client = create_idokep_client(session)
+            await client.close()
+            assert not session.closed
+        finally:
+            await session.close()
+
+    def test_factory_without_session_needs_running_loop(self) -> None:
+        """Creating the client's own session requires a running event loop."""
+        with pytest.raises(RuntimeError):
+            create_idokep_client()
+
+    @pytest.mark.asyncio
+    async def test_session_factory_tunes_connector(self) -> None:
+        """create_idokep_session pools keep-alive connections per host."""
+        session = create_idokep_session()
+        try:
+            connector = session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == IdokepConfig.CONNECTION_LIMIT
+            assert connector.limit_per_host == IdokepConfig.CONNECTION_LIMIT_PER_HOST
+        finally:
+            await session.close()
+
 
 # ---------------------------------------------------------------------------
 # Scrape method exception handling
@@ -1977,3 +2300,47 @@ class TestScrapeExceptionHandling:
         ):
             result = await api_client._scrape_alerts("http://example.com")
             assert result == {}
+
+    @pytest.mark.asyncio
+    async def test_oversized_response_returns_empty_dict(
+        self, api_client: IdokepApiClient, mock_session: Mock
+    ) -> None:
+        """Responses above MAX_RESPONSE_SIZE are rejected before being read."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.content_length = IdokepConfig.MAX_RESPONSE_SIZE + 1
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(return_value=b"")
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = Mock(return_value=mock_response)
+
+        with patch("custom_components.idokep.api.async_timeout.timeout"):
+            result = await api_client._scrape_current_weather("http://example.com")
+
+        assert result == {}
+        mock_response.content.read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_oversized_chunked_response_returns_empty_dict(
+        self, api_client: IdokepApiClient, mock_session: Mock
+    ) -> None:
+        """Responses without Content-Length stop being read past the limit."""
+        mock_response = AsyncMock()
+        mock_response.raise_for_status = Mock()
+        mock_response.content_length = None
+        mock_response.headers = {}
+        mock_response.content.read = AsyncMock(side_effect=[b"x" * 8, b"x" * 8])
+        mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_response.__aexit__ = AsyncMock(return_value=None)
+        mock_session.get = Mock(return_value=mock_response)
+
+        with (
+            patch("custom_components.idokep.api.async_timeout.timeout"),
+            patch.object(IdokepConfig, "MAX_RESPONSE_SIZE", 10),
+        ):
+            result = await api_client._scrape_current_weather("http://example.com")
+
+        assert result == {}
+        # The second read asks for no more than one byte past the limit
+        mock_response.content.read.assert_awaited_with(3)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import datetime
 from datetime import timedelta
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
@@ -270,6 +270,35 @@ class TestIdokepBinarySensor:
         assert attrs["alerts"][0]["level"] == "yellow"
         assert attrs["alerts"][0]["type"] == "wind"
 
+    def test_weather_alert_attributes_rebuilt_on_new_data(
+        self, mock_coordinator: Mock
+    ) -> None:
+        """Alert attributes are reused until the coordinator data changes."""
+        mock_coordinator.data = {"alerts": [], "alerts_by_level": {}}
+        binary_sensor = IdokepBinarySensor(
+            coordinator=mock_coordinator,
+            entity_description=ENTITY_DESCRIPTIONS[2],  # weather_alert
+        )
+
+        attrs = binary_sensor.extra_state_attributes
+        assert binary_sensor.extra_state_attributes is attrs
+        assert attrs["alert_count"] == 0
+
+        mock_coordinator.data = {
+            "alerts": [
+                AlertData(
+                    level="red",
+                    type="storm",
+                    description="Piros riasztás",
+                    icon_url="",
+                )
+            ],
+            "alerts_by_level": {"red": [{"type": "storm"}]},
+        }
+        attrs = binary_sensor.extra_state_attributes
+        assert attrs["alert_count"] == 1
+        assert attrs["red_alerts"] == 1
+
     def test_level_alert_extra_state_attributes(self, mock_coordinator: Mock) -> None:
         """Test extra_state_attributes for level-specific alert sensors."""
         # Setup coordinator data with alerts
@@ -503,3 +532,62 @@ class TestIdokepBinarySensor:
 
         # Should detect storm even with timezone-naive datetime
         assert binary_sensor.is_on is True
+
+    def test_storm_times_parsed_once_per_forecast(self, mock_coordinator: Mock) -> None:
+        """Forecast datetimes are parsed again only when the forecast changes."""
+        soon = datetime.datetime.now(datetime.UTC) + timedelta(minutes=30)
+        forecast = [{"datetime": soon.isoformat(), "condition": "Zivatar"}]
+        mock_coordinator.data = {"hourly_forecast": forecast}
+
+        binary_sensor = IdokepBinarySensor(
+            coordinator=mock_coordinator,
+            entity_description=ENTITY_DESCRIPTIONS[1],  # storm_expected_1h
+        )
+
+        with patch.object(
+            IdokepBinarySensor,
+            "_parse_storm_times",
+            wraps=IdokepBinarySensor._parse_storm_times,
+        ) as mock_parse:
+            assert binary_sensor.is_on is True
+            assert binary_sensor.is_on is True
+            assert mock_parse.call_count == 1
+
+            # A new update brings a new forecast list
+            mock_coordinator.data = {"hourly_forecast": []}
+            assert binary_sensor.is_on is False
+            assert mock_parse.call_count == 2
+
+    def test_sensors_handle_missing_coordinator_data(
+        self, mock_coordinator: Mock
+    ) -> None:
+        """Every sensor reports off when the coordinator has no data yet."""
+        mock_coordinator.data = None
+
+        for entity_description in ENTITY_DESCRIPTIONS:
+            binary_sensor = IdokepBinarySensor(
+                coordinator=mock_coordinator,
+                entity_description=entity_description,
+            )
+            assert binary_sensor.is_on is False
+            assert not binary_sensor.extra_state_attributes.get("alert_count")
+
+    def test_alert_level_sensors_share_empty_attributes(
+        self, mock_coordinator: Mock
+    ) -> None:
+        """Alert level sensors without alerts return one shared read-only mapping."""
+        mock_coordinator.data = {"alerts": [], "alerts_by_level": {}}
+
+        yellow, orange = (
+            IdokepBinarySensor(
+                coordinator=mock_coordinator,
+                entity_description=entity_description,
+            )
+            for entity_description in ENTITY_DESCRIPTIONS[3:5]
+        )
+
+        attrs = yellow.extra_state_attributes
+        assert attrs == {"alert_count": 0, "alerts": ()}
+        assert orange.extra_state_attributes is attrs
+        with pytest.raises(TypeError):
+            attrs["alert_count"] = 1  # type: ignore[index]
@@ -26,6 +26,7 @@ class TestIdokepDataUpdateCoordinator:
 
         expected_message = f"No weather data found for location: {location}"
         assert str(error) == expected_message
+        assert error.location == location
 
     def test_coordinator_initialization(self, mock_hass: Mock) -> None:
         """Test coordinator initialization."""
@@ -208,3 +209,24 @@ class TestIdokepDataUpdateCoordinator:
                 await coordinator._fetch_weather_data("Budapest")
 
             assert "No weather data found for location: Budapest" in str(exc_info.value)
+
+    def test_device_info_shared(self, mock_hass: Mock) -> None:
+        """Test device_info is built once and shared by every caller."""
+        mock_config_entry = Mock()
+        mock_config_entry.domain = "idokep"
+        mock_config_entry.entry_id = "entry_1"
+
+        # Patch the frame helper to avoid RuntimeError
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = IdokepDataUpdateCoordinator(
+                mock_hass,
+                getLogger(__name__),
+                "test_coordinator",
+                timedelta(minutes=30),
+                mock_config_entry,
+            )
+
+            device_info = coordinator.device_info
+            assert device_info["identifiers"] == {("idokep", "entry_1")}
+            assert device_info["name"] == "Időkép"
+            assert coordinator.device_info is device_info
@@ -201,6 +201,26 @@ class TestIdokepSensor:
         sensor = IdokepSensor(coordinator, entity_desc)
         assert sensor.native_value is None
 
+    def test_native_value_timestamp_parsed_once_per_change(self) -> None:
+        """The timestamp string is parsed again only when it changes."""
+        coordinator = Mock()
+        coordinator.data = {"sunrise": "2023-10-01T06:00:00"}
+        entity_desc = SensorEntityDescription(
+            key="sunrise",
+            translation_key="sunrise",
+            device_class=SensorDeviceClass.TIMESTAMP,
+        )
+
+        sensor = IdokepSensor(coordinator, entity_desc)
+        first = sensor.native_value
+        assert sensor.native_value is first
+
+        coordinator.data = {"sunrise": "2023-10-02T06:01:00"}
+        second = sensor.native_value
+        assert isinstance(second, datetime)
+        assert second.day == 2
+        assert second.minute == 1
+
     def test_native_value_timestamp_not_string(self) -> None:
         """Test native_value with non-string timestamp data."""
         coordinator = Mock()